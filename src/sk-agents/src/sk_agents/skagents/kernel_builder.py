@@ -1,10 +1,14 @@
 import logging
+from typing import Any
 
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
 from semantic_kernel.kernel import Kernel
 from ska_utils import AppConfig
 
 from sk_agents.extra_data_collector import ExtraDataCollector
-from sk_agents.plugin_loader import get_plugin_loader
+from sk_agents.plugin_loader import PluginLoader, get_plugin_loader
 from sk_agents.ska_types import ModelType
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.skagents.remote_plugin_loader import RemotePluginLoader
@@ -23,6 +27,9 @@ class KernelBuilder:
         self.app_config: AppConfig = app_config
         self.authorization = authorization
         self.logger = logging.getLogger(__name__)
+        self._plugin_loader: PluginLoader | None = None
+        self._plugin_cache: dict[frozenset[str], dict[str, Any]] = {}
+        self._chat_completion_cache: dict[tuple[str, str], ChatCompletionClientBase] = {}
 
     def build_kernel(
         self,
@@ -53,10 +60,15 @@ class KernelBuilder:
 
     def _create_base_kernel(self, model_name: str, service_id: str) -> Kernel:
         try:
-            chat_completion = self.chat_completion_builder.get_chat_completion_for_model(
-                service_id=service_id,
-                model_name=model_name,
-            )
+            # Kernel.add_service only keeps a reference, so kernels can share one client
+            key = (service_id, model_name)
+            chat_completion = self._chat_completion_cache.get(key)
+            if chat_completion is None:
+                chat_completion = self.chat_completion_builder.get_chat_completion_for_model(
+                    service_id=service_id,
+                    model_name=model_name,
+                )
+                self._chat_completion_cache[key] = chat_completion
 
             kernel = Kernel()
             kernel.add_service(chat_completion)
@@ -76,8 +88,8 @@ class KernelBuilder:
             self.logger.exception(f"Could not load remote plugings. -{e}")
             raise
 
-    @staticmethod
     def _parse_plugins(
+        self,
         plugin_names: list[str],
         kernel: Kernel,
         authorization: str | None = None,
@@ -86,8 +98,17 @@ class KernelBuilder:
         if plugin_names is None or len(plugin_names) < 1:
             return kernel
 
-        plugin_loader = get_plugin_loader()
-        plugins = plugin_loader.get_plugins(plugin_names)
+        plugins = self._get_plugins(plugin_names)
         for k, v in plugins.items():
             kernel.add_plugin(v(authorization, extra_data_collector), k)
         return kernel
+
+    def _get_plugins(self, plugin_names: list[str]) -> dict[str, Any]:
+        key = frozenset(plugin_names)
+        plugins = self._plugin_cache.get(key)
+        if plugins is None:
+            if self._plugin_loader is None:
+                self._plugin_loader = get_plugin_loader()
+            plugins = self._plugin_loader.get_plugins(plugin_names)
+            self._plugin_cache[key] = plugins
+        return plugins
@@ -34,9 +34,12 @@ class Config:
             output_type=config.output_type,
             spec=config.spec,
         )
+        self._agents_by_name: dict[str, AgentConfig] = {}
+        for agent in self.config.spec.agents:
+            self._agents_by_name.setdefault(agent.name, agent)
 
-    def get_agents(self) -> list[AgentConfig]:
-        return self.config.spec.agents
+    def get_agents_by_name(self) -> dict[str, AgentConfig]:
+        return self._agents_by_name
 
     def get_tasks(self) -> list[TaskConfig]:
         return self.config.spec.tasks
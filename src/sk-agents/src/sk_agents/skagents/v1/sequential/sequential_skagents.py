@@ -55,14 +55,15 @@ class SequentialSkagents(BaseHandler):
                 f"Invalid agent configuration: Expected 'spec.tasks', got {config.spec.tasks}"
             )
         sorted_configs = sorted(task_configs, key=lambda x: x.task_no)
+        agent_configs = self.config.get_agents_by_name()
         self.tasks = []
         for i in range(len(sorted_configs) - 1):
             task_config = sorted_configs[i]
-            self.tasks.append(task_builder.build_task(task_config, self.config.get_agents()))
+            self.tasks.append(task_builder.build_task(task_config, agent_configs))
         self.tasks.append(
             task_builder.build_task(
                 sorted_configs[-1],
-                self.config.get_agents(),
+                agent_configs,
                 self.config.config.output_type,
             )
         )
@@ -10,16 +10,18 @@ class TaskBuilder:
         self.agent_builder = agent_builder
 
     @staticmethod
-    def _get_agent_config_by_name(agent_name: str, agent_configs: list[AgentConfig]) -> AgentConfig:
-        for agent_config in agent_configs:
-            if agent_config.name == agent_name:
-                return agent_config
-        raise ValueError(f"Agent {agent_name} not found")
+    def _get_agent_config_by_name(
+        agent_name: str, agent_configs: dict[str, AgentConfig]
+    ) -> AgentConfig:
+        agent_config = agent_configs.get(agent_name)
+        if agent_config is None:
+            raise ValueError(f"Agent {agent_name} not found")
+        return agent_config
 
     def _get_agent_for_task(
         self,
         task_config: TaskConfig,
-        agent_configs: list[AgentConfig],
+        agent_configs: dict[str, AgentConfig],
         extra_data_collector: ExtraDataCollector,
         output_type: str | None = None,
     ) -> SKAgent:
@@ -31,7 +33,7 @@ class TaskBuilder:
     def build_task(
         self,
         task_config: TaskConfig,
-        agent_configs: list[AgentConfig],
+        agent_configs: dict[str, AgentConfig],
         output_type: str | None = None,
     ) -> Task:
         extra_data_collector = ExtraDataCollector()
@@ -1,5 +1,9 @@
 import logging
+from typing import Any
 
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
 from semantic_kernel.kernel import Kernel
 from ska_utils import AppConfig
 
@@ -8,7 +12,7 @@ from sk_agents.auth_storage.secure_auth_storage_manager import SecureAuthStorage
 from sk_agents.authorization.authorizer_factory import AuthorizerFactory
 from sk_agents.authorization.request_authorizer import RequestAuthorizer
 from sk_agents.extra_data_collector import ExtraDataCollector
-from sk_agents.plugin_loader import get_plugin_loader
+from sk_agents.plugin_loader import PluginLoader, get_plugin_loader
 from sk_agents.ska_types import ModelType
 from sk_agents.tealagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.tealagents.remote_plugin_loader import RemotePluginLoader
@@ -27,6 +31,9 @@ class KernelBuilder:
         self.app_config: AppConfig = app_config
         self.authorization = authorization
         self.logger = logging.getLogger(__name__)
+        self._plugin_loader: PluginLoader | None = None
+        self._plugin_cache: dict[frozenset[str], dict[str, Any]] = {}
+        self._chat_completion_cache: dict[tuple[str, str], ChatCompletionClientBase] = {}
 
         # Initialize auth storage and authorizer for token cache functionality
         self.auth_storage_manager: SecureAuthStorageManager = AuthStorageFactory(
@@ -63,10 +70,15 @@ class KernelBuilder:
 
     def _create_base_kernel(self, model_name: str, service_id: str) -> Kernel:
         try:
-            chat_completion = self.chat_completion_builder.get_chat_completion_for_model(
-                service_id=service_id,
-                model_name=model_name,
-            )
+            # Kernel.add_service only keeps a reference, so kernels can share one client
+            key = (service_id, model_name)
+            chat_completion = self._chat_completion_cache.get(key)
+            if chat_completion is None:
+                chat_completion = self.chat_completion_builder.get_chat_completion_for_model(
+                    service_id=service_id,
+                    model_name=model_name,
+                )
+                self._chat_completion_cache[key] = chat_completion
 
             kernel = Kernel()
             kernel.add_service(chat_completion)
@@ -96,8 +108,7 @@ class KernelBuilder:
         if plugin_names is None or len(plugin_names) < 1:
             return kernel
 
-        plugin_loader = get_plugin_loader()
-        plugins = plugin_loader.get_plugins(plugin_names)
+        plugins = self._get_plugins(plugin_names)
 
         for plugin_name, plugin_class in plugins.items():
             # Get plugin-specific authorization (with token cache if available)
@@ -108,6 +119,16 @@ class KernelBuilder:
 
         return kernel
 
+    def _get_plugins(self, plugin_names: list[str]) -> dict[str, Any]:
+        key = frozenset(plugin_names)
+        plugins = self._plugin_cache.get(key)
+        if plugins is None:
+            if self._plugin_loader is None:
+                self._plugin_loader = get_plugin_loader()
+            plugins = self._plugin_loader.get_plugins(plugin_names)
+            self._plugin_cache[key] = plugins
+        return plugins
+
     async def _get_plugin_authorization(
         self, plugin_name: str, original_authorization: str | None = None
     ) -> str | None:
@@ -1,4 +1,7 @@
 import logging
+import os
+from functools import cached_property, lru_cache
+from typing import Any
 
 import httpx
 from pydantic import BaseModel
@@ -7,6 +10,7 @@ from semantic_kernel import Kernel
 from semantic_kernel.connectors.openapi_plugin.openapi_function_execution_parameters import (
     OpenAPIFunctionExecutionParameters,
 )
+from semantic_kernel.connectors.openapi_plugin.openapi_parser import OpenApiParser
 from ska_utils import AppConfig
 
 from sk_agents.configs import TA_REMOTE_PLUGIN_PATH
@@ -21,11 +25,47 @@ class RemotePlugin(BaseModel):
 class RemotePlugins(BaseModel):
     remote_plugins: list[RemotePlugin]
 
-    def get(self, plugin_name: str) -> RemotePlugin | None:
+    @cached_property
+    def _plugins_by_name(self) -> dict[str, RemotePlugin]:
+        plugins_by_name: dict[str, RemotePlugin] = {}
         for remote_plugin in self.remote_plugins:
-            if remote_plugin.plugin_name == plugin_name:
-                return remote_plugin
+            plugins_by_name.setdefault(remote_plugin.plugin_name, remote_plugin)
+        return plugins_by_name
+
+    def get(self, plugin_name: str) -> RemotePlugin | None:
+        return self._plugins_by_name.get(plugin_name)
+
+
+def _read_remote_plugins(plugin_path: str) -> RemotePlugins:
+    return parse_yaml_file_as(RemotePlugins, plugin_path)
+
+
+@lru_cache(maxsize=32)
+def _parse_remote_plugins(plugin_path: str, mtime: float) -> RemotePlugins:
+    return _read_remote_plugins(plugin_path)
+
+
+def _load_remote_plugins(plugin_path: str) -> RemotePlugins:
+    # Catalogs are created per request, so reuse the parsed file until it changes on disk
+    try:
+        mtime = os.path.getmtime(plugin_path)
+    except OSError:
+        return _read_remote_plugins(plugin_path)
+    return _parse_remote_plugins(plugin_path, mtime)
+
+
+@lru_cache(maxsize=32)
+def _parse_openapi_spec(openapi_json_path: str, mtime: float) -> dict[str, Any] | None:
+    return OpenApiParser().parse(openapi_json_path)
+
+
+def _load_openapi_spec(openapi_json_path: str) -> dict[str, Any] | None:
+    # Specs that can't be stat'ed (e.g. URLs) are left for Semantic Kernel to fetch and parse
+    try:
+        mtime = os.path.getmtime(openapi_json_path)
+    except OSError:
         return None
+    return _parse_openapi_spec(openapi_json_path, mtime)
 
 
 class RemotePluginCatalog:
@@ -35,7 +75,7 @@ class RemotePluginCatalog:
         if plugin_path is None:
             self.catalog = None
         else:
-            self.catalog: RemotePlugins = parse_yaml_file_as(RemotePlugins, plugin_path)
+            self.catalog: RemotePlugins = _load_remote_plugins(plugin_path)
 
     def get_remote_plugin(self, plugin_name: str) -> RemotePlugin | None:
         try:
@@ -48,15 +88,23 @@ class RemotePluginCatalog:
 class RemotePluginLoader:
     def __init__(self, catalog: RemotePluginCatalog) -> None:
         self.catalog = catalog
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        # One pooled client is shared by every OpenAPI plugin loaded through this loader
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=httpx.Timeout(60.0))
+        return self._http_client
 
     def load_remote_plugins(self, kernel: Kernel, remote_plugins: list[str]):
         for remote_plugin_name in remote_plugins:
             remote_plugin = self.catalog.get_remote_plugin(remote_plugin_name)
             if remote_plugin:
-                client = httpx.AsyncClient(timeout=httpx.Timeout(60.0))
+                client = self._get_http_client()
                 kernel.add_plugin_from_openapi(
                     plugin_name=remote_plugin.plugin_name,
                     openapi_document_path=remote_plugin.openapi_json_path,
+                    openapi_parsed_spec=_load_openapi_spec(remote_plugin.openapi_json_path),
                     execution_settings=OpenAPIFunctionExecutionParameters(
                         http_client=client,
                         server_url_override=remote_plugin.server_url,
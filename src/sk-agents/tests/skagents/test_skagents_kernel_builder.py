@@ -117,6 +117,23 @@ def test_create_base_kernel_success():
     assert mock_chat_completion in kernel.services.values() or True
 
 
+def test_create_base_kernel_reuses_chat_completion():
+    mock_builder = MagicMock()
+    mock_builder.get_chat_completion_for_model.return_value = MagicMock()
+    builder = KernelBuilder(
+        chat_completion_builder=mock_builder,
+        remote_plugin_loader=MagicMock(),
+        app_config=MagicMock(),
+    )
+
+    with patch("sk_agents.skagents.kernel_builder.Kernel"):
+        builder._create_base_kernel("test-model", "test-service")
+        builder._create_base_kernel("test-model", "test-service")
+        builder._create_base_kernel("other-model", "test-service")
+
+    assert mock_builder.get_chat_completion_for_model.call_count == 2
+
+
 def test_create_base_kernel_failure(caplog):
     mock_builder = MagicMock()
     mock_builder.get_chat_completion_for_model.side_effect = Exception(
@@ -136,15 +153,23 @@ def test_create_base_kernel_failure(caplog):
     assert "Could not create base kernel with service id bad-service." in caplog.text
 
 
+def _kernel_builder() -> KernelBuilder:
+    return KernelBuilder(
+        chat_completion_builder=MagicMock(),
+        remote_plugin_loader=MagicMock(),
+        app_config=MagicMock(),
+    )
+
+
 def test_parse_plugins_empty_list():
     kernel = Kernel()
-    result = KernelBuilder._parse_plugins([], kernel)
+    result = _kernel_builder()._parse_plugins([], kernel)
     assert result is kernel
 
 
 def test_parse_plugins_none():
     kernel = Kernel()
-    result = KernelBuilder._parse_plugins(None, kernel)
+    result = _kernel_builder()._parse_plugins(None, kernel)
     assert result is kernel
 
 
@@ -164,7 +189,7 @@ def test_parse_plugins_with_valid_plugin():
     with patch("sk_agents.skagents.kernel_builder.get_plugin_loader") as mock_loader:
         mock_loader.return_value.get_plugins.return_value = plugin_dict
 
-        result = KernelBuilder._parse_plugins(
+        result = _kernel_builder()._parse_plugins(
             plugin_names=["mock_plugin"],
             kernel=kernel,
             authorization="token",
@@ -202,7 +227,9 @@ def test_parse_plugins_with_multiple_plugins():
     with patch("sk_agents.skagents.kernel_builder.get_plugin_loader") as mock_loader:
         mock_loader.return_value.get_plugins.return_value = plugin_dict
 
-        result = KernelBuilder._parse_plugins(plugin_names=["plugin1", "plugin2"], kernel=kernel)
+        result = _kernel_builder()._parse_plugins(
+            plugin_names=["plugin1", "plugin2"], kernel=kernel
+        )
 
         assert "plugin1" in result.plugins
         assert "plugin2" in result.plugins
@@ -218,7 +245,7 @@ def test_parse_plugins_plugin_loader_failure():
         mock_loader.return_value.get_plugins.side_effect = RuntimeError("Failed to load plugins")
 
         with pytest.raises(RuntimeError, match="Failed to load plugins"):
-            KernelBuilder._parse_plugins(
+            _kernel_builder()._parse_plugins(
                 plugin_names=["some_plugin"],
                 kernel=kernel,
                 authorization="token",
@@ -226,6 +253,33 @@ def test_parse_plugins_plugin_loader_failure():
             )
 
 
+def test_parse_plugins_reuses_resolved_plugins():
+    plugin_class = MagicMock()
+    builder = _kernel_builder()
+
+    with patch("sk_agents.skagents.kernel_builder.get_plugin_loader") as mock_loader:
+        mock_loader.return_value.get_plugins.return_value = {"plugin1": plugin_class}
+
+        builder._parse_plugins(plugin_names=["plugin1"], kernel=MagicMock())
+        builder._parse_plugins(plugin_names=["plugin1"], kernel=MagicMock())
+
+        mock_loader.return_value.get_plugins.assert_called_once_with(["plugin1"])
+        assert plugin_class.call_count == 2
+
+
+def test_parse_plugins_resolves_plugin_loader_once():
+    builder = _kernel_builder()
+
+    with patch("sk_agents.skagents.kernel_builder.get_plugin_loader") as mock_loader:
+        mock_loader.return_value.get_plugins.return_value = {}
+
+        builder._parse_plugins(plugin_names=["plugin1"], kernel=MagicMock())
+        builder._parse_plugins(plugin_names=["plugin2"], kernel=MagicMock())
+
+        mock_loader.assert_called_once_with()
+        assert mock_loader.return_value.get_plugins.call_count == 2
+
+
 def test_load_remote_plugins_with_none_or_empty():
     kb = KernelBuilder(
         chat_completion_builder=MagicMock(),
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +10,7 @@ from sk_agents.skagents.remote_plugin_loader import (
     RemotePluginCatalog,
     RemotePluginLoader,
     RemotePlugins,
+    _read_remote_plugins,
 )
 
 
@@ -40,14 +42,65 @@ def test_get_plugin_not_found(remote_plugin):
     assert result is None
 
 
-@patch("sk_agents.skagents.remote_plugin_loader.parse_yaml_file_as")
-def test_catalog_initialization_with_path(mock_parse_yaml, app_config):
+@patch("sk_agents.skagents.remote_plugin_loader._read_remote_plugins")
+def test_catalog_initialization_with_path(mock_read_remote_plugins, app_config):
     mock_catalog = Mock(spec=RemotePlugins)
-    mock_parse_yaml.return_value = mock_catalog
+    mock_read_remote_plugins.return_value = mock_catalog
     catalog = RemotePluginCatalog(app_config)
     assert catalog.catalog == mock_catalog
 
 
+def test_catalog_reuses_parsed_file_until_modified(tmp_path):
+    plugin_file = tmp_path / "plugins.yaml"
+    plugin_file.write_text(
+        "remote_plugins:\n"
+        "  - plugin_name: test_plugin\n"
+        "    openapi_json_path: path/to/openapi.json\n"
+    )
+    mock_config = Mock(spec=AppConfig)
+    mock_config.get.return_value = str(plugin_file)
+
+    with patch(
+        "sk_agents.skagents.remote_plugin_loader._read_remote_plugins", wraps=_read_remote_plugins
+    ) as mock_read_remote_plugins:
+        first = RemotePluginCatalog(mock_config)
+        second = RemotePluginCatalog(mock_config)
+        assert mock_read_remote_plugins.call_count == 1
+        assert second.catalog is first.catalog
+
+        stat = plugin_file.stat()
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        RemotePluginCatalog(mock_config)
+        assert mock_read_remote_plugins.call_count == 2
+
+
+def test_catalog_keeps_bool_like_plugin_names_as_strings(tmp_path):
+    plugin_file = tmp_path / "plugins.yaml"
+    plugin_file.write_text(
+        "remote_plugins:\n  - plugin_name: on\n    openapi_json_path: path/to/openapi.json\n"
+    )
+    mock_config = Mock(spec=AppConfig)
+    mock_config.get.return_value = str(plugin_file)
+
+    catalog = RemotePluginCatalog(mock_config)
+    assert catalog.get_remote_plugin("on").plugin_name == "on"
+
+
+def test_catalog_rejects_duplicate_keys(tmp_path):
+    plugin_file = tmp_path / "plugins.yaml"
+    plugin_file.write_text(
+        "remote_plugins:\n"
+        "  - plugin_name: first\n"
+        "    plugin_name: second\n"
+        "    openapi_json_path: path/to/openapi.json\n"
+    )
+    mock_config = Mock(spec=AppConfig)
+    mock_config.get.return_value = str(plugin_file)
+
+    with pytest.raises(Exception, match="duplicate key"):
+        RemotePluginCatalog(mock_config)
+
+
 def test_catalog_initialization_without_path():
     mock_config = Mock(spec=AppConfig)
     mock_config.get.return_value = None
@@ -55,10 +108,10 @@ def test_catalog_initialization_without_path():
     assert catalog.catalog is None
 
 
-@patch("sk_agents.skagents.remote_plugin_loader.parse_yaml_file_as")
-def test_get_remote_plugin_success(mock_parse_yaml, remote_plugin):
+@patch("sk_agents.skagents.remote_plugin_loader._read_remote_plugins")
+def test_get_remote_plugin_success(mock_read_remote_plugins, remote_plugin):
     # Provide a realistic RemotePlugins instance to the catalog
-    mock_parse_yaml.return_value = RemotePlugins(remote_plugins=[remote_plugin])
+    mock_read_remote_plugins.return_value = RemotePlugins(remote_plugins=[remote_plugin])
 
     mock_app_config = Mock()
     mock_app_config.get.return_value = "dummy_plugin_path.yaml"
@@ -68,14 +121,14 @@ def test_get_remote_plugin_success(mock_parse_yaml, remote_plugin):
     assert result == remote_plugin
 
 
-@patch("sk_agents.skagents.remote_plugin_loader.parse_yaml_file_as")
-def test_get_remote_plugin_exception(mock_parse_yaml):
+@patch("sk_agents.skagents.remote_plugin_loader._read_remote_plugins")
+def test_get_remote_plugin_exception(mock_read_remote_plugins):
     # Mock the catalog with a broken `.get` to simulate exception
     broken_catalog = Mock(spec=RemotePlugins)
     broken_catalog.get.side_effect = Exception("simulated failure")
 
-    # Mock parse_yaml_file_as to return the broken catalog
-    mock_parse_yaml.return_value = broken_catalog
+    # Mock _read_remote_plugins to return the broken catalog
+    mock_read_remote_plugins.return_value = broken_catalog
 
     mock_app_config = Mock()
     mock_app_config.get.return_value = "dummy_plugin_path.yaml"
@@ -114,6 +167,28 @@ def test_load_remote_plugin_success(mock_kernel_class, mock_async_client_class,
     assert call_kwargs["execution_settings"].server_url_override == remote_plugin.server_url
 
 
+@patch("sk_agents.skagents.remote_plugin_loader.OpenApiParser")
+def test_load_remote_plugin_reuses_parsed_spec(mock_parser_class, tmp_path):
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text("{}")
+    parsed_spec = {"paths": {}}
+    mock_parser_class.return_value.parse.return_value = parsed_spec
+    mock_kernel = Mock()
+
+    catalog = Mock()
+    catalog.get_remote_plugin.return_value = RemotePlugin(
+        plugin_name="test_plugin", openapi_json_path=str(spec_file)
+    )
+
+    loader = RemotePluginLoader(catalog)
+    loader.load_remote_plugins(mock_kernel, ["test_plugin"])
+    loader.load_remote_plugins(mock_kernel, ["test_plugin"])
+
+    mock_parser_class.return_value.parse.assert_called_once_with(str(spec_file))
+    for add_call in mock_kernel.add_plugin_from_openapi.call_args_list:
+        assert add_call.kwargs["openapi_parsed_spec"] is parsed_spec
+
+
 @patch("sk_agents.skagents.remote_plugin_loader.Kernel")
 def test_load_remote_plugin_not_found(mock_kernel):
     catalog = Mock()
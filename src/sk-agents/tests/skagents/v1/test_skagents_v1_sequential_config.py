@@ -0,0 +1,59 @@
+from sk_agents.ska_types import BaseConfig
+from sk_agents.skagents.v1.sequential.config import Config
+
+
+def _base_config(agents: list[dict]) -> BaseConfig:
+    return BaseConfig(
+        apiVersion="skagents/v1",
+        service_name="test-service",
+        version=0.1,
+        spec={
+            "agents": agents,
+            "tasks": [
+                {
+                    "name": "task1",
+                    "task_no": 1,
+                    "description": "Test task",
+                    "instructions": "Do the thing",
+                    "agent": "agent1",
+                }
+            ],
+        },
+    )
+
+
+class TestGetAgentsByName:
+    """Test Config.get_agents_by_name."""
+
+    def test_indexes_agents_by_name(self):
+        """Test agents are keyed by their name."""
+        config = Config(
+            _base_config(
+                [
+                    {"name": "agent1", "model": "gpt-4o", "system_prompt": "First"},
+                    {"name": "agent2", "model": "gpt-4o-mini", "system_prompt": "Second"},
+                ]
+            )
+        )
+
+        agents = config.get_agents_by_name()
+
+        assert list(agents) == ["agent1", "agent2"]
+        assert agents["agent1"].model == "gpt-4o"
+        assert agents["agent2"].model == "gpt-4o-mini"
+
+    def test_duplicate_names_keep_first_agent(self):
+        """Test the first agent wins when names are duplicated."""
+        config = Config(
+            _base_config(
+                [
+                    {"name": "agent1", "model": "gpt-4o", "system_prompt": "First"},
+                    {"name": "agent1", "model": "gpt-4o-mini", "system_prompt": "Second"},
+                ]
+            )
+        )
+
+        agents = config.get_agents_by_name()
+
+        assert len(agents) == 1
+        assert agents["agent1"].system_prompt == "First"
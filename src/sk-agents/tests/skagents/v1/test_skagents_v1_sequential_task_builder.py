@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from sk_agents.extra_data_collector import ExtraDataCollector
+from sk_agents.skagents.v1.agent_builder import AgentBuilder
+from sk_agents.skagents.v1.sequential.config import AgentConfig, TaskConfig
+from sk_agents.skagents.v1.sequential.task_builder import TaskBuilder
+
+
+@pytest.fixture
+def agent_configs():
+    """Create agent configs keyed by name."""
+    return {
+        "agent1": AgentConfig(name="agent1", model="gpt-4o", system_prompt="First"),
+        "agent2": AgentConfig(name="agent2", model="gpt-4o-mini", system_prompt="Second"),
+    }
+
+
+@pytest.fixture
+def task_config():
+    """Create a task assigned to agent2."""
+    return TaskConfig(
+        name="task1",
+        task_no=1,
+        description="Test task",
+        instructions="Do the thing",
+        agent="agent2",
+    )
+
+
+class TestGetAgentConfigByName:
+    """Test TaskBuilder._get_agent_config_by_name."""
+
+    def test_returns_matching_agent(self, agent_configs):
+        """Test the named agent config is returned."""
+        result = TaskBuilder._get_agent_config_by_name("agent2", agent_configs)
+
+        assert result is agent_configs["agent2"]
+
+    def test_missing_agent_raises(self, agent_configs):
+        """Test an unknown agent name raises ValueError."""
+        with pytest.raises(ValueError, match="Agent unknown not found"):
+            TaskBuilder._get_agent_config_by_name("unknown", agent_configs)
+
+
+class TestBuildTask:
+    """Test TaskBuilder.build_task."""
+
+    def test_builds_task_with_named_agent(self, agent_configs, task_config):
+        """Test the task's agent is built from the matching agent config."""
+        agent_builder = MagicMock(spec=AgentBuilder)
+        task_builder = TaskBuilder(agent_builder)
+
+        task = task_builder.build_task(task_config, agent_configs, "OutputType")
+
+        agent_builder.build_agent.assert_called_once()
+        agent_config, extra_data_collector, output_type = agent_builder.build_agent.call_args.args
+        assert agent_config is agent_configs["agent2"]
+        assert isinstance(extra_data_collector, ExtraDataCollector)
+        assert output_type == "OutputType"
+        assert task.name == "task1"
+        assert task.agent is agent_builder.build_agent.return_value
+
+    def test_unknown_agent_raises(self, agent_configs, task_config):
+        """Test building a task for an unknown agent raises ValueError."""
+        task_builder = TaskBuilder(MagicMock(spec=AgentBuilder))
+        task_config.agent = "unknown"
+
+        with pytest.raises(ValueError, match="Agent unknown not found"):
+            task_builder.build_task(task_config, agent_configs)
@@ -296,6 +296,16 @@ class TestCreateBaseKernel:
             service_id="test-service", model_name="gpt-4o"
         )
 
+    def test_create_base_kernel_reuses_chat_completion(self, kernel_builder):
+        """Test chat completion clients are reused per service ID and model."""
+        get_chat_completion = kernel_builder.chat_completion_builder.get_chat_completion_for_model
+
+        kernel_builder._create_base_kernel("gpt-4o", "test-service")
+        kernel_builder._create_base_kernel("gpt-4o", "test-service")
+        kernel_builder._create_base_kernel("gpt-4o-mini", "test-service")
+
+        assert get_chat_completion.call_count == 2
+
     def test_create_base_kernel_exception_handling(self, kernel_builder):
         """Test _create_base_kernel exception handling."""
         kernel_builder.chat_completion_builder.get_chat_completion_for_model.side_effect = (
@@ -446,6 +456,23 @@ class TestParsePlugins:
         mock_plugin_class1.assert_called_once()
         mock_plugin_class2.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_parse_plugins_reuses_resolved_plugins(self, kernel_builder):
+        """Test plugin classes are resolved once but instantiated per call."""
+        mock_plugin_loader = MagicMock()
+        mock_plugin_class = MagicMock()
+        mock_plugin_loader.get_plugins.return_value = {"test_plugin": mock_plugin_class}
+
+        with patch(
+            "sk_agents.tealagents.kernel_builder.get_plugin_loader",
+            return_value=mock_plugin_loader,
+        ):
+            await kernel_builder._parse_plugins(["test_plugin"], MagicMock())
+            await kernel_builder._parse_plugins(["test_plugin"], MagicMock())
+
+        mock_plugin_loader.get_plugins.assert_called_once_with(["test_plugin"])
+        assert mock_plugin_class.call_count == 2
+
 
 class TestGetPluginAuthorization:
     """Test _get_plugin_authorization method."""
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +12,7 @@ from sk_agents.tealagents.remote_plugin_loader import (
     RemotePluginCatalog,
     RemotePluginLoader,
     RemotePlugins,
+    _read_remote_plugins,
 )
 
 
@@ -138,21 +140,29 @@ class TestRemotePlugins:
         assert result.plugin_name == "plugin2"
         assert result.openapi_json_path == "/path/2.json"
 
+    def test_get_duplicate_name_returns_first(self):
+        """Test that the first plugin wins when names are duplicated."""
+        first = RemotePlugin(plugin_name="dup", openapi_json_path="/path/first.json")
+        second = RemotePlugin(plugin_name="dup", openapi_json_path="/path/second.json")
+        plugins = RemotePlugins(remote_plugins=[first, second])
+
+        assert plugins.get("dup") is first
+
 
 class TestRemotePluginCatalog:
     """Test RemotePluginCatalog class."""
 
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
-    def test_init_with_plugin_path(self, mock_parse_yaml, mock_app_config_with_path):
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
+    def test_init_with_plugin_path(self, mock_read_remote_plugins, mock_app_config_with_path):
         """Test initialization with plugin path."""
         mock_remote_plugins = MagicMock(spec=RemotePlugins)
-        mock_parse_yaml.return_value = mock_remote_plugins
+        mock_read_remote_plugins.return_value = mock_remote_plugins
 
         catalog = RemotePluginCatalog(mock_app_config_with_path)
 
         assert catalog.catalog is mock_remote_plugins
         mock_app_config_with_path.get.assert_called_once_with(TA_REMOTE_PLUGIN_PATH.env_name)
-        mock_parse_yaml.assert_called_once_with(RemotePlugins, "/path/to/plugins.yaml")
+        mock_read_remote_plugins.assert_called_once_with("/path/to/plugins.yaml")
 
     def test_init_without_plugin_path(self, mock_app_config_no_path):
         """Test initialization without plugin path."""
@@ -161,8 +171,8 @@ class TestRemotePluginCatalog:
         assert catalog.catalog is None
         mock_app_config_no_path.get.assert_called_once_with(TA_REMOTE_PLUGIN_PATH.env_name)
 
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
-    def test_get_remote_plugin_success(self, mock_parse_yaml, mock_app_config_with_path):
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
+    def test_get_remote_plugin_success(self, mock_read_remote_plugins, mock_app_config_with_path):
         """Test getting remote plugin successfully."""
         sample_plugin = RemotePlugin(
             plugin_name="test_plugin",
@@ -170,7 +180,7 @@ class TestRemotePluginCatalog:
         )
         mock_remote_plugins = MagicMock(spec=RemotePlugins)
         mock_remote_plugins.get.return_value = sample_plugin
-        mock_parse_yaml.return_value = mock_remote_plugins
+        mock_read_remote_plugins.return_value = mock_remote_plugins
 
         catalog = RemotePluginCatalog(mock_app_config_with_path)
         result = catalog.get_remote_plugin("test_plugin")
@@ -178,12 +188,12 @@ class TestRemotePluginCatalog:
         assert result is sample_plugin
         mock_remote_plugins.get.assert_called_once_with("test_plugin")
 
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
-    def test_get_remote_plugin_not_found(self, mock_parse_yaml, mock_app_config_with_path):
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
+    def test_get_remote_plugin_not_found(self, mock_read_remote_plugins, mock_app_config_with_path):
         """Test getting remote plugin that doesn't exist."""
         mock_remote_plugins = MagicMock(spec=RemotePlugins)
         mock_remote_plugins.get.return_value = None
-        mock_parse_yaml.return_value = mock_remote_plugins
+        mock_read_remote_plugins.return_value = mock_remote_plugins
 
         catalog = RemotePluginCatalog(mock_app_config_with_path)
         result = catalog.get_remote_plugin("non_existing_plugin")
@@ -191,24 +201,28 @@ class TestRemotePluginCatalog:
         assert result is None
         mock_remote_plugins.get.assert_called_once_with("non_existing_plugin")
 
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
-    def test_get_remote_plugin_exception_handling(self, mock_parse_yaml, mock_app_config_with_path):
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
+    def test_get_remote_plugin_exception_handling(
+        self, mock_read_remote_plugins, mock_app_config_with_path
+    ):
         """Test exception handling in get_remote_plugin."""
         mock_remote_plugins = MagicMock(spec=RemotePlugins)
         mock_remote_plugins.get.side_effect = Exception("Catalog error")
-        mock_parse_yaml.return_value = mock_remote_plugins
+        mock_read_remote_plugins.return_value = mock_remote_plugins
 
         catalog = RemotePluginCatalog(mock_app_config_with_path)
 
         with pytest.raises(Exception, match="Catalog error"):
             catalog.get_remote_plugin("test_plugin")
 
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
-    def test_get_remote_plugin_logs_exception(self, mock_parse_yaml, mock_app_config_with_path):
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
+    def test_get_remote_plugin_logs_exception(
+        self, mock_read_remote_plugins, mock_app_config_with_path
+    ):
         """Test that get_remote_plugin logs exceptions."""
         mock_remote_plugins = MagicMock(spec=RemotePlugins)
         mock_remote_plugins.get.side_effect = ValueError("Test error")
-        mock_parse_yaml.return_value = mock_remote_plugins
+        mock_read_remote_plugins.return_value = mock_remote_plugins
 
         catalog = RemotePluginCatalog(mock_app_config_with_path)
 
@@ -219,6 +233,62 @@ class TestRemotePluginCatalog:
             mock_log.assert_called_once()
             assert "could not get remote pluging test_plugin" in str(mock_log.call_args)
 
+    def test_init_reuses_parsed_file_until_modified(self, tmp_path):
+        """Test that the plugin file is only read again when its mtime changes."""
+        plugin_file = tmp_path / "plugins.yaml"
+        plugin_file.write_text(
+            "remote_plugins:\n"
+            "  - plugin_name: test_plugin\n"
+            "    openapi_json_path: /path/to/openapi.json\n"
+        )
+        config = MagicMock(spec=AppConfig)
+        config.get.return_value = str(plugin_file)
+
+        with patch(
+            "sk_agents.tealagents.remote_plugin_loader._read_remote_plugins",
+            wraps=_read_remote_plugins,
+        ) as mock_read_remote_plugins:
+            first = RemotePluginCatalog(config)
+            second = RemotePluginCatalog(config)
+
+            assert mock_read_remote_plugins.call_count == 1
+            assert second.catalog is first.catalog
+
+            stat = plugin_file.stat()
+            os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            third = RemotePluginCatalog(config)
+
+            assert mock_read_remote_plugins.call_count == 2
+            assert third.get_remote_plugin("test_plugin").plugin_name == "test_plugin"
+
+    def test_init_keeps_bool_like_plugin_names_as_strings(self, tmp_path):
+        """Test that YAML 1.1 booleans such as 'on' stay plugin name strings."""
+        plugin_file = tmp_path / "plugins.yaml"
+        plugin_file.write_text(
+            "remote_plugins:\n  - plugin_name: on\n    openapi_json_path: /path/to/openapi.json\n"
+        )
+        config = MagicMock(spec=AppConfig)
+        config.get.return_value = str(plugin_file)
+
+        catalog = RemotePluginCatalog(config)
+
+        assert catalog.get_remote_plugin("on").plugin_name == "on"
+
+    def test_init_rejects_duplicate_keys(self, tmp_path):
+        """Test that a plugin file with duplicate keys fails to parse."""
+        plugin_file = tmp_path / "plugins.yaml"
+        plugin_file.write_text(
+            "remote_plugins:\n"
+            "  - plugin_name: first\n"
+            "    plugin_name: second\n"
+            "    openapi_json_path: /path/to/openapi.json\n"
+        )
+        config = MagicMock(spec=AppConfig)
+        config.get.return_value = str(plugin_file)
+
+        with pytest.raises(Exception, match="duplicate key"):
+            RemotePluginCatalog(config)
+
 
 class TestRemotePluginLoader:
     """Test RemotePluginLoader class."""
@@ -275,6 +345,7 @@ class TestRemotePluginLoader:
         mock_add_plugin.assert_called_once_with(
             plugin_name="test_plugin",
             openapi_document_path="/path/to/openapi.json",
+            openapi_parsed_spec=None,
             execution_settings=mock_execution_settings,
         )
 
@@ -335,9 +406,34 @@ class TestRemotePluginLoader:
         loader.load_remote_plugins(kernel, ["plugin1", "plugin2"])
 
         assert loader.catalog.get_remote_plugin.call_count == 2
-        assert mock_async_client_class.call_count == 2
+        mock_async_client_class.assert_called_once()
         assert mock_add_plugin.call_count == 2
         assert mock_exec_params.call_count == 2
+        for exec_call in mock_exec_params.call_args_list:
+            assert exec_call.kwargs["http_client"] is mock_client
+
+    @patch("sk_agents.tealagents.remote_plugin_loader.Kernel.add_plugin_from_openapi")
+    @patch("sk_agents.tealagents.remote_plugin_loader.OpenApiParser")
+    def test_load_remote_plugins_reuses_parsed_spec(
+        self, mock_parser_class, mock_add_plugin, loader, tmp_path
+    ):
+        """Test that a local OpenAPI spec is parsed once and shared across kernels."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text("{}")
+        parsed_spec = {"paths": {}}
+        mock_parser_class.return_value.parse.return_value = parsed_spec
+        loader.catalog.get_remote_plugin.return_value = RemotePlugin(
+            plugin_name="test_plugin",
+            openapi_json_path=str(spec_file),
+        )
+
+        loader.load_remote_plugins(Kernel(), ["test_plugin"])
+        loader.load_remote_plugins(Kernel(), ["test_plugin"])
+
+        mock_parser_class.return_value.parse.assert_called_once_with(str(spec_file))
+        assert mock_add_plugin.call_count == 2
+        for add_call in mock_add_plugin.call_args_list:
+            assert add_call.kwargs["openapi_parsed_spec"] is parsed_spec
 
     def test_load_remote_plugins_plugin_not_found(self, loader):
         """Test loading remote plugin that doesn't exist in catalog."""
@@ -417,12 +513,12 @@ class TestIntegration:
 
     @patch("sk_agents.tealagents.remote_plugin_loader.OpenAPIFunctionExecutionParameters")
     @patch("sk_agents.tealagents.remote_plugin_loader.Kernel.add_plugin_from_openapi")
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
     @patch("sk_agents.tealagents.remote_plugin_loader.httpx.AsyncClient")
     def test_end_to_end_plugin_loading(
         self,
         mock_async_client_class,
-        mock_parse_yaml,
+        mock_read_remote_plugins,
         mock_add_plugin,
         mock_exec_params,
         mock_app_config_with_path,
@@ -446,7 +542,7 @@ class TestIntegration:
         )
 
         remote_plugins_collection = RemotePlugins(remote_plugins=[plugin1, plugin2])
-        mock_parse_yaml.return_value = remote_plugins_collection
+        mock_read_remote_plugins.return_value = remote_plugins_collection
 
         # Create catalog and loader
         catalog = RemotePluginCatalog(mock_app_config_with_path)
@@ -479,8 +575,10 @@ class TestIntegration:
         assert second_params_call["server_url_override"] is None
         assert second_params_call["http_client"] is mock_client
 
-    @patch("sk_agents.tealagents.remote_plugin_loader.parse_yaml_file_as")
-    def test_catalog_with_no_path_loader_behavior(self, mock_parse_yaml, mock_app_config_no_path):
+    @patch("sk_agents.tealagents.remote_plugin_loader._read_remote_plugins")
+    def test_catalog_with_no_path_loader_behavior(
+        self, mock_read_remote_plugins, mock_app_config_no_path
+    ):
         """Test behavior when catalog has no plugin path configured."""
         catalog = RemotePluginCatalog(mock_app_config_no_path)
         loader = RemotePluginLoader(catalog)